@@ -55,7 +55,7 @@ def query_system(query_data: dict):
     decrypted_results = []
     for doc, score in results:
         decrypted_content = hipaa_storage.decrypt_phi(doc)
-        decrypted_results.append({"content": decrypted_content, "score": score})
+        decrypted_results.append({"content": decrypted_content, "score": float(score)})
 
     return {"results": decrypted_results}
 
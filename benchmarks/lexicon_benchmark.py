@@ -0,0 +1,172 @@
+# lexicon_benchmark.py
+import argparse
+import json
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+from lexicon.medical_lexicon import compile_lexicon_file, tokenize
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process, in bytes."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Peak RSS is the best portable fallback (KiB on Linux, bytes on macOS)
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def generate_terms(path: str, count: int, seed: int = 0):
+    """Write count synthetic terms and multi-word phrases, one per line."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        for _ in range(count):
+            words = rng.randint(1, 4)
+            phrase = " ".join(
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+                for _ in range(words)
+            )
+            file.write(phrase + "\n")
+
+
+def generate_text(term_file: str, path: str, tokens: int, seed: int = 0):
+    """Write tokens words of random filler with known terms mixed in."""
+    rng = random.Random(seed)
+    with open(term_file, "r", encoding="utf-8") as file:
+        sample = [line.strip() for _, line in zip(range(10_000), file) if line.strip()]
+    words = []
+    while len(words) < tokens:
+        if rng.random() < 0.2:
+            words.extend(rng.choice(sample).split())
+        else:
+            words.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))))
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(" ".join(words[:tokens]))
+
+
+def set_find_terms(terms: set, max_tokens: int, text: str) -> List[str]:
+    """Leftmost-longest phrase matching against a plain set, as a baseline for find_terms."""
+    tokens = tokenize(text)
+    matches = []
+    i = 0
+    while i < len(tokens):
+        for end in range(min(i + max_tokens, len(tokens)), i, -1):
+            phrase = " ".join(tokens[i:end])
+            if phrase in terms:
+                matches.append(phrase)
+                i = end
+                break
+        else:
+            i += 1
+    return matches
+
+
+def measure(mode: str, path: str, text_path: str, probes: int) -> dict:
+    """Load terms with the given loader and report load time, RSS and lookup costs."""
+    with open(text_path, "r", encoding="utf-8") as file:
+        text = file.read()
+    rng = random.Random(1)
+    keys = ["".join(rng.choices(string.ascii_lowercase, k=8)) for _ in range(probes)]
+
+    rss_before = current_rss_bytes()
+    start = time.perf_counter()
+    if mode == "set":
+        from utils.helpers import load_medical_terms
+        terms = load_medical_terms(path)
+        max_tokens = max((t.count(" ") + 1 for t in terms), default=0)
+        contains = terms.__contains__
+        find_terms = lambda text: set_find_terms(terms, max_tokens, text)
+    else:
+        from lexicon.medical_lexicon import MedicalLexicon
+        terms = MedicalLexicon.open(path)
+        contains = terms.__contains__
+        find_terms = terms.find_terms
+    load_seconds = time.perf_counter() - start
+    rss_loaded = current_rss_bytes()
+
+    start = time.perf_counter()
+    for key in keys:
+        contains(key)
+    lookup_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matches = find_terms(text)
+    find_seconds = time.perf_counter() - start
+    # mmap pages count towards RSS only once the lookups touch them; they are
+    # file-backed, so the kernel can share them between workers and reclaim them
+    rss_used = current_rss_bytes()
+
+    mb = 1024 * 1024
+    return {
+        "mode": mode,
+        "terms": len(terms),
+        "load_seconds": load_seconds,
+        "rss_loaded_mb": (rss_loaded - rss_before) / mb,
+        "rss_used_mb": (rss_used - rss_before) / mb,
+        "lookup_us": lookup_seconds / max(probes, 1) * 1e6,
+        "find_us_per_token": find_seconds / max(len(tokenize(text)), 1) * 1e6,
+        "matches": len(matches),
+    }
+
+
+def run_isolated(mode: str, path: str, text_path: str, probes: int) -> dict:
+    """Run a measurement in a fresh interpreter so loaders do not share memory."""
+    output = subprocess.check_output(
+        [sys.executable, "-m", "benchmarks.lexicon_benchmark",
+         "--measure", mode, "--path", path, "--text", text_path, "--probes", str(probes)],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    return json.loads(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the set-based term loader with the mmap'd lexicon")
+    parser.add_argument("--terms", type=int, default=1_000_000, help="Number of synthetic terms")
+    parser.add_argument("--term-file", help="Existing one-term-per-line file instead of synthetic terms")
+    parser.add_argument("--probes", type=int, default=100_000, help="Number of membership lookups")
+    parser.add_argument("--text-tokens", type=int, default=200_000, help="Words of text for phrase matching")
+    parser.add_argument("--measure", choices=["set", "lexicon"], help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    parser.add_argument("--text", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.path, args.text, args.probes)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        term_file = args.term_file
+        if term_file is None:
+            term_file = os.path.join(tmpdir, "terms.txt")
+            generate_terms(term_file, args.terms)
+        lexicon_file = os.path.join(tmpdir, "terms.lex")
+        text_file = os.path.join(tmpdir, "text.txt")
+        generate_text(term_file, text_file, args.text_tokens)
+
+        start = time.perf_counter()
+        compile_lexicon_file(term_file, lexicon_file)
+        compile_seconds = time.perf_counter() - start
+
+        print(f"compiled lexicon: {os.path.getsize(lexicon_file) / (1024 * 1024):.1f} MB "
+              f"in {compile_seconds:.2f}s (offline)")
+        print(f"{'loader':<10}{'terms':>10}{'load (s)':>10}{'RSS load':>10}{'RSS used':>10}"
+              f"{'lookup (us)':>13}{'find (us/tok)':>15}{'matches':>9}")
+        for mode, path in (("set", term_file), ("lexicon", lexicon_file)):
+            r = run_isolated(mode, path, text_file, args.probes)
+            print(f"{mode:<10}{r['terms']:>10}{r['load_seconds']:>10.3f}{r['rss_loaded_mb']:>10.1f}"
+                  f"{r['rss_used_mb']:>10.1f}{r['lookup_us']:>13.2f}{r['find_us_per_token']:>15.2f}"
+                  f"{r['matches']:>9}")
+        print("RSS in MB: after loading, and after the lookups and phrase matching")
+
+
+if __name__ == "__main__":
+    main()
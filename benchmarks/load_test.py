@@ -0,0 +1,260 @@
+# load_test.py
+"""HTTP load test for the FastAPI service running on stub models.
+
+Worker count 0 drives the app in-process through httpx.ASGITransport;
+any other count starts ``uvicorn benchmarks.stub_app:app --workers N``
+and drives it over local HTTP. Every (workers, threadpool) combination
+is run with the same mixed /process_document/ and /query/ workload.
+"""
+import argparse
+import asyncio
+import itertools
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+QUERIES = [
+    "What are the recent advancements in heart failure treatment?",
+    "Which patients respond to the new treatment arm?",
+    "How does blood pressure change in the trial cohort?",
+    "What do the study findings conclude about heart rate?",
+]
+
+
+def make_document(index: int) -> dict:
+    """Build a document payload that passes MedicalDataValidator."""
+    body = " ".join(
+        f"Patient cohort {index} received treatment arm {i % 7} with measured blood pressure and heart rate."
+        for i in range(10)
+    )
+    return {
+        "doc_id": f"load-{index}",
+        "content": f"This study reports clinical trial results. {body} The findings support the conclusion.",
+        "source": "Load Test Journal",
+        "publication_date": datetime(2023, 1, 1).isoformat(),
+        "medical_categories": ["Cardiology"],
+        "confidence_score": 0.9,
+        "verified_by_medical_professional": True,
+        "citations": [{"title": "Reference Study", "link": "http://example.com/study"}],
+    }
+
+
+@dataclass
+class EndpointStats:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def summarize(stats: Dict[str, EndpointStats], elapsed: float) -> Dict[str, Dict[str, float]]:
+    """Throughput, latency percentiles (ms) and error rate per endpoint."""
+    summary = {}
+    for endpoint, endpoint_stats in stats.items():
+        count = endpoint_stats.count
+        summary[endpoint] = {
+            "requests": count,
+            "throughput": count / elapsed if elapsed > 0 else 0.0,
+            "p50_ms": percentile(endpoint_stats.latencies, 50) * 1000,
+            "p90_ms": percentile(endpoint_stats.latencies, 90) * 1000,
+            "p99_ms": percentile(endpoint_stats.latencies, 99) * 1000,
+            "max_ms": max(endpoint_stats.latencies, default=0.0) * 1000,
+            "error_rate": endpoint_stats.errors / count if count else 0.0,
+        }
+    return summary
+
+
+async def _send(client: httpx.AsyncClient, endpoint: str, payload: dict, stats: EndpointStats,
+                scheduled: Optional[float] = None):
+    # Open-loop requests are timed from their scheduled arrival, so time spent
+    # queued behind the concurrency limit is counted (no coordinated omission)
+    start = scheduled if scheduled is not None else time.perf_counter()
+    try:
+        response = await client.post(endpoint, json=payload)
+        failed = response.status_code >= 400
+    except httpx.HTTPError:
+        failed = True
+    stats.latencies.append(time.perf_counter() - start)
+    if failed:
+        stats.errors += 1
+
+
+async def run_workload(client: httpx.AsyncClient,
+                       requests: int,
+                       concurrency: int,
+                       rate: Optional[float] = None,
+                       query_ratio: float = 0.8,
+                       seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Send a mixed workload and return per-endpoint statistics.
+
+    At most ``concurrency`` requests are in flight. With ``rate`` set,
+    requests arrive on a Poisson schedule of that many per second and
+    latency is measured from the scheduled arrival; otherwise they are
+    sent as fast as the concurrency limit allows.
+    """
+    rng = random.Random(seed)
+    stats = {"/process_document/": EndpointStats(), "/query/": EndpointStats()}
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = []
+
+    async def limited(endpoint, payload, scheduled):
+        try:
+            await _send(client, endpoint, payload, stats[endpoint], scheduled)
+        finally:
+            semaphore.release()
+
+    start = time.perf_counter()
+    next_start = start
+    for index in range(requests):
+        if rng.random() < query_ratio:
+            endpoint, payload = "/query/", {"query": rng.choice(QUERIES)}
+        else:
+            endpoint, payload = "/process_document/", make_document(index)
+        scheduled = None
+        if rate:
+            next_start += rng.expovariate(rate)
+            scheduled = next_start
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(limited(endpoint, payload, scheduled)))
+    await asyncio.gather(*tasks)
+    return summarize(stats, time.perf_counter() - start)
+
+
+async def run_in_process(threadpool: int, **workload) -> Dict[str, Dict[str, float]]:
+    """Drive the stub app in this process through an ASGI transport."""
+    from benchmarks.stub_app import app, configure_threadpool, reset_rag_system
+
+    # Start every run from the same seeded index so results stay comparable
+    reset_rag_system()
+    configure_threadpool(threadpool)
+    # Unhandled app errors become 500 responses, as they would behind uvicorn
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        return await run_workload(client, **workload)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            if httpx.get(base_url + "/").status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"Server at {base_url} did not start within {timeout}s")
+
+
+def run_with_server(workers: int, threadpool: int, startup_timeout: float = 60.0,
+                    **workload) -> Dict[str, Dict[str, float]]:
+    """Start uvicorn with the given worker count and drive it over local HTTP."""
+    from cryptography.fernet import Fernet
+
+    port = _free_port()
+    env = dict(os.environ,
+               LOAD_TEST_THREADPOOL=str(threadpool),
+               # Workers must share a key; otherwise each one generates its own
+               ENCRYPTION_KEY=os.environ.get("ENCRYPTION_KEY") or Fernet.generate_key().decode())
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.stub_app:app",
+         "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_until_ready(base_url, process, startup_timeout)
+        limits = httpx.Limits(max_connections=workload["concurrency"])
+
+        async def drive():
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+                return await run_workload(client, **workload)
+
+        return asyncio.run(drive())
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def sweep(workers: List[int], threadpools: List[int], **workload) -> List[dict]:
+    """Run the workload for every (workers, threadpool) combination."""
+    results = []
+    for worker_count, threadpool in itertools.product(workers, threadpools):
+        if worker_count == 0:
+            summary = asyncio.run(run_in_process(threadpool, **workload))
+        else:
+            summary = run_with_server(worker_count, threadpool, **workload)
+        results.append({"workers": worker_count, "threadpool": threadpool, "endpoints": summary})
+    return results
+
+
+def print_report(results: List[dict]):
+    header = (f"{'workers':>8}{'threads':>8}  {'endpoint':<20}{'reqs':>7}{'req/s':>9}"
+              f"{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}{'errors':>8}")
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        workers = result["workers"] or "in-proc"
+        for endpoint, s in result["endpoints"].items():
+            print(f"{workers:>8}{result['threadpool']:>8}  {endpoint:<20}{s['requests']:>7}"
+                  f"{s['throughput']:>9.1f}{s['p50_ms']:>9.1f}{s['p90_ms']:>9.1f}"
+                  f"{s['p99_ms']:>9.1f}{s['max_ms']:>9.1f}{s['error_rate']:>8.1%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the Medical AI API with stub models")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, default=16, help="Maximum requests in flight")
+    parser.add_argument("--rate", type=float, help="Target arrival rate in requests/second (default: unthrottled)")
+    parser.add_argument("--query-ratio", type=float, default=0.8, help="Fraction of requests sent to /query/")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0],
+                        help="Uvicorn worker counts to sweep; 0 runs the app in-process")
+    parser.add_argument("--threadpool", type=int, nargs="+", default=[40],
+                        help="Threadpool sizes for sync endpoints to sweep")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    results = sweep(args.workers, args.threadpool,
+                    requests=args.requests, concurrency=args.concurrency, rate=args.rate,
+                    query_ratio=args.query_ratio, seed=args.seed)
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
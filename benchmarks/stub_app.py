@@ -0,0 +1,124 @@
+# stub_app.py
+"""FastAPI app wired to deterministic CPU stub models for load testing.
+
+app.main downloads real models at import time, so the stubs are installed
+as the ``sentence_transformers`` module before app.main is imported. This
+module can be served directly, e.g. ``uvicorn benchmarks.stub_app:app --workers 4``.
+"""
+import os
+import sys
+import time
+import types
+import zlib
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+EMBEDDING_DIM = 384
+STUB_COST_MS = float(os.environ.get("LOAD_TEST_STUB_COST_MS", "0"))
+THREADPOOL_SIZE = os.environ.get("LOAD_TEST_THREADPOOL")
+SEED_DOCUMENTS = int(os.environ.get("LOAD_TEST_SEED_DOCUMENTS", "20"))
+
+
+def _burn_cpu(milliseconds: float):
+    """Busy-wait to stand in for model inference cost."""
+    if milliseconds <= 0:
+        return
+    deadline = time.perf_counter() + milliseconds / 1000
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _tokens(text: str) -> List[str]:
+    return text.lower().split()
+
+
+class StubSentenceTransformer:
+    """Deterministic hashing encoder with the SentenceTransformer.encode interface."""
+
+    def __init__(self, model_name_or_path: str = None, *args, **kwargs):
+        self.model_name = model_name_or_path
+
+    def encode(self, sentences, *args, **kwargs) -> np.ndarray:
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        embeddings = np.zeros((len(sentences), EMBEDDING_DIM), dtype='float32')
+        for row, sentence in enumerate(sentences):
+            _burn_cpu(STUB_COST_MS)
+            for token in _tokens(sentence):
+                embeddings[row, zlib.crc32(token.encode()) % EMBEDDING_DIM] += 1.0
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings /= np.where(norms == 0, 1.0, norms)
+        return embeddings[0] if single else embeddings
+
+
+class StubCrossEncoder:
+    """Deterministic token-overlap scorer with the CrossEncoder.predict interface."""
+
+    def __init__(self, model_name: str = None, *args, **kwargs):
+        self.model_name = model_name
+
+    def predict(self, sentence_pairs: Sequence[Tuple[str, str]], *args, **kwargs) -> np.ndarray:
+        scores = []
+        for query, doc in sentence_pairs:
+            _burn_cpu(STUB_COST_MS / 10)
+            query_tokens = set(_tokens(query))
+            doc_tokens = set(_tokens(doc))
+            scores.append(len(query_tokens & doc_tokens) / max(len(query_tokens), 1))
+        return np.array(scores, dtype='float32')
+
+
+def install_stub_models():
+    """Register the stubs as the sentence_transformers module."""
+    if "app.main" in sys.modules or "rag.enhanced_rag" in sys.modules:
+        raise RuntimeError("Stub models must be installed before app.main is imported")
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = StubSentenceTransformer
+    module.CrossEncoder = StubCrossEncoder
+    sys.modules["sentence_transformers"] = module
+
+
+def seed_documents(count: int):
+    """Index documents directly so queries never hit an empty index in any worker."""
+    from benchmarks.load_test import make_document
+    for index in range(count):
+        main.process_document(make_document(-1 - index))
+
+
+def reset_rag_system():
+    """Replace the app's RAG system with a freshly seeded one."""
+    main.rag_system = EnhancedRAG(main.base_embedder)
+    seed_documents(SEED_DOCUMENTS)
+
+
+def configure_threadpool(size: int):
+    """Resize the threadpool that runs sync FastAPI endpoints; call inside the event loop."""
+    from anyio import to_thread
+    to_thread.current_default_thread_limiter().total_tokens = size
+
+
+class ThreadpoolSizeMiddleware:
+    """ASGI middleware that applies the threadpool size inside the server's event loop."""
+
+    def __init__(self, app, size: int):
+        self.app = app
+        self.size = size
+        self.configured = False
+
+    async def __call__(self, scope, receive, send):
+        if not self.configured:
+            configure_threadpool(self.size)
+            self.configured = True
+        await self.app(scope, receive, send)
+
+
+install_stub_models()
+from app import main  # noqa: E402
+from rag.enhanced_rag import EnhancedRAG  # noqa: E402
+
+app = main.app
+seed_documents(SEED_DOCUMENTS)
+
+if THREADPOOL_SIZE:
+    app.add_middleware(ThreadpoolSizeMiddleware, size=int(THREADPOOL_SIZE))
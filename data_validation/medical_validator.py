@@ -1,9 +1,10 @@
 # medical_validator.py
-from typing import Dict, List
+from typing import Dict, List, Optional
 import re
 from datetime import datetime
 from pydantic import BaseModel, validator
 import logging
+from lexicon.medical_lexicon import MedicalLexicon, normalize_term
 
 class MedicalDocument(BaseModel):
     """Pydantic model for medical document validation"""
@@ -36,9 +37,17 @@ class MedicalDocument(BaseModel):
         return v
 
 class MedicalDataValidator:
-    def __init__(self):
+    def __init__(self, blacklist_path: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
-        self.blacklist_terms = self._load_blacklist()
+        # A compiled lexicon file replaces the built-in blacklist entirely;
+        # its matches are reported in normalized form
+        if blacklist_path:
+            self.blacklist_terms = []
+            self.blacklist_lexicon = MedicalLexicon.open(blacklist_path)
+        else:
+            self.blacklist_terms = self._load_blacklist()
+            self.blacklist_lexicon = MedicalLexicon.from_terms(self.blacklist_terms)
+        self._blacklist_originals = {normalize_term(term): term for term in self.blacklist_terms}
 
     def _load_blacklist(self) -> List[str]:
         # Load terms that should trigger additional review
@@ -49,6 +58,16 @@ class MedicalDataValidator:
             "100% effective"
         ]
 
+    def close(self):
+        """Release the memory-mapped blacklist lexicon"""
+        self.blacklist_lexicon.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def validate_document(self, doc_data: dict) -> MedicalDocument:
         """Comprehensive validation of medical documents"""
         # Validate using Pydantic model
@@ -61,10 +80,10 @@ class MedicalDataValidator:
         }
 
         # Check for blacklisted terms
-        for term in self.blacklist_terms:
-            if term.lower() in doc.content.lower():
-                validation_results["warnings"].append(f"Contains potentially problematic term: {term}")
-                validation_results["requires_review"] = True
+        for match in dict.fromkeys(self.blacklist_lexicon.find_terms(doc.content)):
+            term = self._blacklist_originals.get(match, match)
+            validation_results["warnings"].append(f"Contains potentially problematic term: {term}")
+            validation_results["requires_review"] = True
 
         # Validate citations
         if not doc.citations:
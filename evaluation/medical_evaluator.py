@@ -1,20 +1,36 @@
 # medical_evaluator.py
-from typing import List, Dict
-import re
+from typing import List, Dict, Optional
 import numpy as np
+from lexicon.medical_lexicon import MedicalLexicon, tokenize
 
 class MedicalModelEvaluator:
-    def __init__(self):
+    def __init__(self, lexicon_path: Optional[str] = None):
         self.metrics = {}
-        self.medical_taxonomy = self._load_medical_taxonomy()
+        self.medical_taxonomy = self._load_medical_taxonomy(lexicon_path)
     
-    def _load_medical_taxonomy(self):
+    def _load_medical_taxonomy(self, lexicon_path: Optional[str] = None):
         """Load medical specialty categories and terminology"""
-        # This would load from a comprehensive medical taxonomy file
+        # A compiled lexicon file is memory-mapped; otherwise fall back to the built-in terms
+        if lexicon_path:
+            terminology = MedicalLexicon.open(lexicon_path)
+        else:
+            terminology = MedicalLexicon.from_terms(
+                ["heart", "brain", "cancer", "treatment", "diagnosis", "therapy", "symptom"]
+            )
         return {
             "specialties": ["cardiology", "neurology", "oncology"],
-            "terminology": set(["heart", "brain", "cancer", "treatment", "diagnosis", "therapy", "symptom"])
+            "terminology": terminology
         }
+
+    def close(self):
+        """Release the memory-mapped terminology lexicon"""
+        self.medical_taxonomy["terminology"].close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     def evaluate_response(self, 
                           query: str, 
@@ -56,8 +72,12 @@ class MedicalModelEvaluator:
     
     def _evaluate_medical_precision(self, response: str) -> float:
         """Evaluate precision of medical terminology usage"""
-        response_tokens = set(re.findall(r'\b\w+\b', response.lower()))
-        medical_terms_used = response_tokens.intersection(self.medical_taxonomy['terminology'])
+        tokens = tokenize(response)
+        response_tokens = set(tokens)
+        # Count the distinct tokens covered by matched terms, so multi-word
+        # phrases weigh the same as the tokens they use up
+        spans = self.medical_taxonomy['terminology'].match_spans(tokens)
+        medical_terms_used = {tokens[i] for start, end, _ in spans for i in range(start, end)}
         if not response_tokens:
             return 0.0
         precision = len(medical_terms_used) / len(response_tokens)
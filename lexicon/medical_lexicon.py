@@ -0,0 +1,197 @@
+# medical_lexicon.py
+import argparse
+import io
+import mmap
+import re
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, List, Optional, Tuple, Union
+
+MAGIC = b"MEDLEX01"
+# magic, term count, longest phrase (in tokens), reserved
+HEADER = struct.Struct("<8sQII")
+OFFSET = struct.Struct("<Q")
+
+# A trailing percent sign stays on its number, so "100%" and "100" differ
+TOKEN_PATTERN = re.compile(r"\w+%?")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens, keeping percentages such as "100%"."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def normalize_term(term: str) -> str:
+    """Normalize a term or phrase to single-space separated lowercase tokens."""
+    return " ".join(tokenize(term))
+
+
+def _write_table(terms: Iterable[str], out: BinaryIO) -> int:
+    """Write the sorted string table for terms to out and return the term count."""
+    encoded = sorted({normalize_term(t).encode("utf-8") for t in terms} - {b""})
+    max_tokens = max((t.count(b" ") + 1 for t in encoded), default=0)
+
+    out.write(HEADER.pack(MAGIC, len(encoded), max_tokens, 0))
+    offset = 0
+    out.write(OFFSET.pack(offset))
+    for term in encoded:
+        offset += len(term)
+        out.write(OFFSET.pack(offset))
+    for term in encoded:
+        out.write(term)
+    return len(encoded)
+
+
+def compile_lexicon(terms: Iterable[str], output_path: str) -> int:
+    """Compile terms into an on-disk lexicon file and return the term count.
+
+    The file is a sorted string table: a fixed header, an array of
+    little-endian uint64 offsets and the concatenated UTF-8 terms in
+    byte order, so it can be memory-mapped and binary searched in place.
+    """
+    with open(output_path, "wb") as out:
+        return _write_table(terms, out)
+
+
+def compile_lexicon_file(input_path: str, output_path: str) -> int:
+    """Compile a one-term-per-line text file into an on-disk lexicon."""
+    with open(input_path, "r", encoding="utf-8") as file:
+        return compile_lexicon((line.strip() for line in file), output_path)
+
+
+class MedicalLexicon:
+    """Read-only term lexicon backed by a memory-mapped sorted string table."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap], file: Optional[BinaryIO] = None):
+        magic, count, max_tokens, _ = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a medical lexicon file")
+        self._buffer = buffer
+        self._file = file
+        self._count = count
+        self.max_tokens = max_tokens
+        self._data_start = HEADER.size + OFFSET.size * (count + 1)
+        # Offsets are read in place; big-endian hosts need a byte-swapped copy
+        offsets = memoryview(buffer)[HEADER.size:self._data_start]
+        if sys.byteorder == "little":
+            self._offsets = offsets.cast("Q")
+        else:
+            self._offsets = array("Q", offsets)
+            self._offsets.byteswap()
+            offsets.release()
+
+    @classmethod
+    def open(cls, path: str) -> "MedicalLexicon":
+        """Memory-map a compiled lexicon file."""
+        file = open(path, "rb")
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            file.close()
+            raise
+        return cls(buffer, file)
+
+    @classmethod
+    def from_terms(cls, terms: Iterable[str]) -> "MedicalLexicon":
+        """Build a small in-memory lexicon, e.g. for built-in term lists."""
+        out = io.BytesIO()
+        _write_table(terms, out)
+        return cls(out.getvalue())
+
+    def close(self):
+        # The offsets view must be released before the mmap can be closed
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _term_at(self, index: int) -> bytes:
+        offsets, base = self._offsets, self._data_start
+        return self._buffer[base + offsets[index]:base + offsets[index + 1]]
+
+    def _lower_bound(self, key: bytes, lo: int = 0) -> int:
+        buffer, offsets, base = self._buffer, self._offsets, self._data_start
+        hi = self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if buffer[base + offsets[mid]:base + offsets[mid + 1]] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def __contains__(self, term: str) -> bool:
+        key = normalize_term(term).encode("utf-8")
+        index = self._lower_bound(key)
+        return index < self._count and self._term_at(index) == key
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._term_at(index).decode("utf-8")
+
+    def match_spans(self, tokens: List[str]) -> List[Tuple[int, int, str]]:
+        """Find leftmost-longest, non-overlapping term matches in a token list.
+
+        Returns (start, end, term) tuples where tokens[start:end] is the term.
+        """
+        count = self._count
+        encoded = [token.encode("utf-8") for token in tokens]
+        matches = []
+        i = 0
+        while i < len(encoded):
+            key = encoded[i]
+            longest = None
+            j = i
+            lo = 0
+            while True:
+                index = self._lower_bound(key, lo)
+                term = self._term_at(index) if index < count else b""
+                if term == key:
+                    longest = j + 1
+                    index += 1
+                    term = self._term_at(index) if index < count else b""
+                # Normalized terms contain no bytes below b" ", so the first term
+                # extending key is the one at or right after its lower bound
+                if j + 1 >= len(encoded) or j + 1 - i >= self.max_tokens:
+                    break
+                if not term.startswith(key + b" "):
+                    break
+                j += 1
+                key += b" " + encoded[j]
+                lo = index
+            if longest is None:
+                i += 1
+            else:
+                matches.append((i, longest, " ".join(tokens[i:longest])))
+                i = longest
+        return matches
+
+    def find_terms(self, text: str) -> List[str]:
+        """Return the lexicon terms found in text, in order of occurrence."""
+        return [term for _, _, term in self.match_spans(tokenize(text))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile a medical term list into a lexicon file")
+    parser.add_argument("input", help="Text file with one term or phrase per line")
+    parser.add_argument("output", help="Path of the compiled lexicon file")
+    args = parser.parse_args(argv)
+    count = compile_lexicon_file(args.input, args.output)
+    print(f"Compiled {count} terms into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
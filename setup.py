@@ -18,7 +18,8 @@ setup(
         'mlflow',
         'torch',
         'streamlit',
-        'requests'
+        'requests',
+        'httpx'
     ],
     entry_points={
         'console_scripts': [
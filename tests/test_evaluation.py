@@ -1,6 +1,9 @@
 # test_evaluation.py
+import os
+import tempfile
 import unittest
 from evaluation.medical_evaluator import MedicalModelEvaluator
+from lexicon.medical_lexicon import compile_lexicon
 
 class TestMedicalEvaluator(unittest.TestCase):
     def setUp(self):
@@ -16,5 +19,25 @@ class TestMedicalEvaluator(unittest.TestCase):
         self.assertIsInstance(evaluation, dict)
         self.assertIn("factual_accuracy", evaluation)
 
+    def test_medical_precision_with_compiled_lexicon(self):
+        response = "Myocardial infarction requires urgent treatment"
+        builtin_precision = self.evaluator.evaluate_response("", response, "", [])["medical_precision"]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "terms.lex")
+            compile_lexicon(["myocardial infarction", "treatment"], path)
+            with MedicalModelEvaluator(lexicon_path=path) as evaluator:
+                precision = evaluator.evaluate_response("", response, "", [])["medical_precision"]
+        self.assertAlmostEqual(builtin_precision, 1 / 5)
+        self.assertAlmostEqual(precision, 3 / 5)
+
+    def test_medical_precision_with_overlapping_phrases(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "terms.lex")
+            compile_lexicon(["blood pressure", "pressure blood", "blood"], path)
+            with MedicalModelEvaluator(lexicon_path=path) as evaluator:
+                precision = evaluator._evaluate_medical_precision("blood pressure pressure blood blood")
+        self.assertLessEqual(precision, 1.0)
+        self.assertAlmostEqual(precision, 1.0)
+
 if __name__ == '__main__':
     unittest.main()
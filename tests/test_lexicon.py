@@ -0,0 +1,44 @@
+# test_lexicon.py
+import os
+import tempfile
+import unittest
+from lexicon.medical_lexicon import MedicalLexicon, compile_lexicon
+
+class TestMedicalLexicon(unittest.TestCase):
+    def setUp(self):
+        self.terms = ["Heart", "heart failure", "congestive heart failure", "brain", "heartburn", "Heart"]
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "terms.lex")
+        self.count = compile_lexicon(self.terms, self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_compile_and_lookup(self):
+        self.assertEqual(self.count, 5)
+        with MedicalLexicon.open(self.path) as lexicon:
+            self.assertEqual(len(lexicon), 5)
+            self.assertIn("HEART  failure", lexicon)
+            self.assertNotIn("congestive heart", lexicon)
+            self.assertEqual(list(lexicon), sorted(list(lexicon)))
+
+    def test_longest_match(self):
+        text = "Congestive heart failure, heartburn and a heart attack affect the brain."
+        with MedicalLexicon.open(self.path) as lexicon:
+            found = lexicon.find_terms(text)
+        self.assertEqual(found, ["congestive heart failure", "heartburn", "heart", "brain"])
+
+    def test_partial_phrase_falls_back_to_shorter_match(self):
+        lexicon = MedicalLexicon.from_terms(["blood", "blood pressure monitor", "pressure"])
+        self.assertEqual(lexicon.match_spans(["blood", "pressure", "cuff"]),
+                         [(0, 1, "blood"), (1, 2, "pressure")])
+        self.assertEqual(lexicon.find_terms("blood pressure monitor"), ["blood pressure monitor"])
+
+    def test_from_terms_matches_file(self):
+        text = "Heart failure was ruled out by the brain scan."
+        in_memory = MedicalLexicon.from_terms(self.terms)
+        with MedicalLexicon.open(self.path) as lexicon:
+            self.assertEqual(in_memory.find_terms(text), lexicon.find_terms(text))
+
+if __name__ == '__main__':
+    unittest.main()
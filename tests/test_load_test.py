@@ -0,0 +1,61 @@
+# test_load_test.py
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import unittest
+from benchmarks.load_test import EndpointStats, _send, percentile, summarize
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class FakeResponse:
+    status_code = 200
+
+class FakeClient:
+    async def post(self, endpoint, json=None):
+        return FakeResponse()
+
+class TestLoadTest(unittest.TestCase):
+    def test_percentile(self):
+        values = [0.1 * i for i in range(1, 11)]
+        self.assertAlmostEqual(percentile(values, 50), 0.5)
+        self.assertAlmostEqual(percentile(values, 99), 1.0)
+        self.assertEqual(percentile([], 50), 0.0)
+        # Sizes where rounding instead of ceil would pick a lower rank
+        self.assertEqual(percentile(list(range(1, 26)), 90), 23)
+        self.assertEqual(percentile(list(range(1, 151)), 99), 149)
+        self.assertEqual(percentile(list(range(1, 1001)), 99.9), 1000)
+        self.assertEqual(percentile(list(range(1, 1001)), 0), 1)
+
+    def test_summarize(self):
+        stats = {"/query/": EndpointStats(latencies=[0.01, 0.02, 0.03, 0.04], errors=1)}
+        summary = summarize(stats, elapsed=2.0)
+        self.assertEqual(summary["/query/"]["requests"], 4)
+        self.assertAlmostEqual(summary["/query/"]["throughput"], 2.0)
+        self.assertAlmostEqual(summary["/query/"]["error_rate"], 0.25)
+
+    def test_open_loop_latency_counts_queueing(self):
+        stats = EndpointStats()
+        scheduled = time.perf_counter() - 0.5
+        asyncio.run(_send(FakeClient(), "/query/", {}, stats, scheduled))
+        self.assertGreaterEqual(stats.latencies[0], 0.5)
+
+    def test_in_process_sweep(self):
+        # Stub models replace sentence_transformers, so run outside this test process
+        script = (
+            "import json; from benchmarks.load_test import sweep; "
+            "print(json.dumps(sweep([0], [4, 8], requests=30, concurrency=4)))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", script], cwd=PROJECT_ROOT)
+        results = json.loads(output.decode().strip().splitlines()[-1])
+        self.assertEqual(len(results), 2)
+        for result in results:
+            endpoints = result["endpoints"]
+            self.assertEqual(sum(s["requests"] for s in endpoints.values()), 30)
+            for summary in endpoints.values():
+                self.assertEqual(summary["error_rate"], 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,29 @@
 # test_validation.py
+import os
+import tempfile
 import unittest
 from data_validation.medical_validator import MedicalDataValidator, MedicalDocument
+from lexicon.medical_lexicon import compile_lexicon
 from datetime import datetime
 
+LONG_CONTENT = (
+    "This study analyzes the treatment of patients with a new drug. "
+    + "Each patient was followed for twelve weeks with regular clinical visits and laboratory tests. " * 8
+    + "The results and conclusions are promising. "
+)
+
+def make_doc_data(content):
+    return {
+        "doc_id": "123",
+        "content": content,
+        "source": "Medical Journal",
+        "publication_date": datetime.now(),
+        "medical_categories": ["Cardiology"],
+        "confidence_score": 0.9,
+        "verified_by_medical_professional": True,
+        "citations": [{"title": "Previous Study", "link": "http://example.com"}]
+    }
+
 class TestMedicalValidator(unittest.TestCase):
     def setUp(self):
         self.validator = MedicalDataValidator()
@@ -49,5 +70,39 @@ class TestMedicalValidator(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.validator.validate_document(doc_data)
 
+    def test_blacklist_warning_names_original_term(self):
+        doc_data = make_doc_data(LONG_CONTENT + "The sponsor claims it is 100% effective.")
+        with self.assertRaises(ValueError) as ctx:
+            self.validator.validate_document(doc_data)
+        self.assertIn("Contains potentially problematic term: 100% effective", str(ctx.exception))
+
+    def test_blacklist_matches_whole_words(self):
+        content = LONG_CONTENT + "No drug can cure allergies, and 100 effective doses were given."
+        doc = self.validator.validate_document(make_doc_data(content))
+        self.assertIsInstance(doc, MedicalDocument)
+
+    def test_blacklist_ignores_spacing_and_punctuation(self):
+        for phrase, term in [("a miracle  treatment", "miracle treatment"),
+                             ("a miracle\ntreatment", "miracle treatment"),
+                             ("a cure-all", "cure all")]:
+            with self.assertRaises(ValueError) as ctx:
+                self.validator.validate_document(make_doc_data(LONG_CONTENT + f"It is {phrase}."))
+            self.assertIn(f"Contains potentially problematic term: {term}", str(ctx.exception))
+
+    def test_blacklist_percentage_must_match_at_span(self):
+        content = LONG_CONTENT + "We saw 100 effective results and 100% effectiveness overall."
+        doc = self.validator.validate_document(make_doc_data(content))
+        self.assertIsInstance(doc, MedicalDocument)
+
+    def test_compiled_blacklist_replaces_builtin(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "blacklist.lex")
+            compile_lexicon(["detox cleanse"], path)
+            with MedicalDataValidator(blacklist_path=path) as validator:
+                validator.validate_document(make_doc_data(LONG_CONTENT + "It is a miracle treatment."))
+                with self.assertRaises(ValueError) as ctx:
+                    validator.validate_document(make_doc_data(LONG_CONTENT + "Try this Detox Cleanse."))
+        self.assertIn("detox cleanse", str(ctx.exception))
+
 if __name__ == '__main__':
     unittest.main()